@@ -51,8 +51,8 @@ async def command_favorite(blind: GenericBlind) -> None:
     await blind.async_favorite()
 
 
-BUTTON_TYPES: dict[str, CommandButtonEntityDescription] = {
-    ATTR_CONNECT: CommandButtonEntityDescription(
+BUTTON_DESCRIPTIONS: tuple[CommandButtonEntityDescription, ...] = (
+    CommandButtonEntityDescription(
         key=ATTR_CONNECT,
         translation_key=ATTR_CONNECT,
         icon=ICON_CONNECT,
@@ -60,7 +60,7 @@ BUTTON_TYPES: dict[str, CommandButtonEntityDescription] = {
         has_entity_name=True,
         command_callback=command_connect,
     ),
-    ATTR_DISCONNECT: CommandButtonEntityDescription(
+    CommandButtonEntityDescription(
         key=ATTR_DISCONNECT,
         translation_key=ATTR_DISCONNECT,
         icon=ICON_DISCONNECT,
@@ -68,7 +68,7 @@ BUTTON_TYPES: dict[str, CommandButtonEntityDescription] = {
         has_entity_name=True,
         command_callback=command_disconnect,
     ),
-    ATTR_FAVORITE: CommandButtonEntityDescription(
+    CommandButtonEntityDescription(
         key=ATTR_FAVORITE,
         translation_key=ATTR_FAVORITE,
         icon=ICON_FAVORITE,
@@ -76,7 +76,7 @@ BUTTON_TYPES: dict[str, CommandButtonEntityDescription] = {
         has_entity_name=True,
         command_callback=command_favorite,
     ),
-}
+)
 
 
 async def async_setup_entry(
@@ -89,7 +89,7 @@ async def async_setup_entry(
     async_add_entities(
         [
             GenericCommandButton(blind, entity_description)
-            for entity_description in BUTTON_TYPES.values()
+            for entity_description in BUTTON_DESCRIPTIONS
         ]
     )
 
@@ -1,11 +1,11 @@
 """Config flow for MotionBlinds BLE integration."""
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 import logging
-import re
 from typing import Any
 
-from bleak.backends.device import BLEDevice
 import voluptuous as vol
 
 from homeassistant.components import bluetooth
@@ -25,17 +25,33 @@ from .const import (
     CONF_LOCAL_NAME,
     CONF_MAC_CODE,
     DOMAIN,
+    ENTITY_NAME,
     ERROR_ALREADY_CONFIGURED,
     ERROR_COULD_NOT_FIND_MOTOR,
     ERROR_INVALID_MAC_CODE,
     ERROR_NO_BLUETOOTH_ADAPTER,
     ERROR_NO_DEVICES_FOUND,
+    SETTING_DISCOVERY_TIMEOUT,
     MotionBlindType,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = vol.Schema({vol.Required(CONF_MAC_CODE): str})
+CONFIRM_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_BLIND_TYPE): SelectSelector(
+            SelectSelectorConfig(
+                options=[blind_type.value for blind_type in MotionBlindType],
+                translation_key=CONF_BLIND_TYPE,
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        )
+    }
+)
+
+HEX_CHARACTERS = frozenset("0123456789abcdefABCDEF")
+LOCAL_NAME_PREFIX = "MOTION_"
 
 
 class FlowHandler(ConfigFlow, domain=DOMAIN):
@@ -43,7 +59,7 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
-    _discovery_info: BluetoothServiceInfoBleak | BLEDevice | None = None
+    _discovery_info: BluetoothServiceInfoBleak | None = None
     _mac_code: str | None = None
     _display_name: str | None = None
     _blind_type: MotionBlindType | None = None
@@ -60,7 +76,7 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
 
         self._discovery_info = discovery_info
         self._mac_code = get_mac_from_local_name(discovery_info.name)
-        self._display_name = f"MotionBlind {self._mac_code}"
+        self._display_name = ENTITY_NAME.format(mac_code=self._mac_code)
         self.context["local_name"] = discovery_info.name
         self.context["title_placeholders"] = {"name": self._display_name}
 
@@ -112,26 +128,15 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_BLIND_TYPE): SelectSelector(
-                        SelectSelectorConfig(
-                            options=[
-                                blind_type.value for blind_type in MotionBlindType
-                            ],
-                            translation_key=CONF_BLIND_TYPE,
-                            mode=SelectSelectorMode.DROPDOWN,
-                        )
-                    )
-                }
-            ),
+            data_schema=CONFIRM_SCHEMA,
             description_placeholders={"display_name": self._display_name},
         )
 
     async def async_discover_motionblind(self, mac_code: str) -> None:
         """Discover MotionBlinds initialized by the user."""
+        mac_code = mac_code.upper()
         if not is_valid_mac(mac_code):
-            _LOGGER.error("Invalid MAC code: %s", mac_code.upper())
+            _LOGGER.error("Invalid MAC code: %s", mac_code)
             raise InvalidMACCode()
 
         count = bluetooth.async_scanner_count(self.hass, connectable=True)
@@ -142,55 +147,69 @@ class FlowHandler(ConfigFlow, domain=DOMAIN):
             _LOGGER.error("No bluetooth adapter found")
             raise NoBluetoothAdapter()
 
-        bleak_scanner = bluetooth.async_get_scanner(self.hass)
-        devices = await bleak_scanner.discover()
-
-        if len(devices) == 0:
-            _LOGGER.error("Could not find any bluetooth devices")
-            raise NoDevicesFound()
-
-        motion_device: BLEDevice | None = next(
+        local_name = f"{LOCAL_NAME_PREFIX}{mac_code}"
+        discovered_service_infos = list(
+            bluetooth.async_discovered_service_info(self.hass, connectable=True)
+        )
+        motion_service_info: BluetoothServiceInfoBleak | None = next(
             (
-                device
-                for device in devices
-                if device
-                and device.name
-                and f"MOTION_{mac_code.upper()}" in device.name
+                service_info
+                for service_info in discovered_service_infos
+                if service_info.name == local_name
             ),
             None,
         )
 
+        if not motion_service_info:
+            # Not seen by the passive scanner yet, wait shortly for an advertisement
+            try:
+                motion_service_info = await bluetooth.async_process_advertisements(
+                    self.hass,
+                    lambda service_info: service_info.name == local_name,
+                    {"connectable": True},
+                    bluetooth.BluetoothScanningMode.ACTIVE,
+                    SETTING_DISCOVERY_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                motion_service_info = None
+
+        if not motion_service_info and len(discovered_service_infos) == 0:
+            _LOGGER.error("Could not find any bluetooth devices")
+            raise NoDevicesFound()
+
         existing_entries = self._async_current_entries()
 
-        if not motion_device:
-            _LOGGER.error("Could not find a motor with MAC code: %s", mac_code.upper())
+        if not motion_service_info:
+            _LOGGER.error("Could not find a motor with MAC code: %s", mac_code)
             raise CouldNotFindMotor()
 
-        unique_id = motion_device.address
+        unique_id = motion_service_info.address
         if any(entry.unique_id == unique_id for entry in existing_entries):
             _LOGGER.error(
-                "Device with MAC code %s has already been configured", mac_code.upper()
+                "Device with MAC code %s has already been configured", mac_code
             )
             raise AlreadyConfigured()
         await self.async_set_unique_id(unique_id, raise_on_progress=False)
-        self._discovery_info = motion_device
-        self._mac_code = mac_code.upper()
-        self._display_name = f"MotionBlind {self._mac_code}"
+        self._discovery_info = motion_service_info
+        self._mac_code = mac_code
+        self._display_name = ENTITY_NAME.format(mac_code=self._mac_code)
 
 
 def is_valid_mac(data: str) -> bool:
     """Validate the provided MAC address."""
 
-    mac_regex = r"^[0-9A-Fa-f]{4}$"
-    return bool(re.match(mac_regex, data))
+    return len(data) == 4 and HEX_CHARACTERS.issuperset(data)
 
 
+@lru_cache(maxsize=256)
 def get_mac_from_local_name(data: str) -> str | None:
     """Get the MAC address from the bluetooth local name."""
 
-    mac_regex = r"^MOTION_([0-9A-Fa-f]{4})$"
-    match = re.search(mac_regex, data)
-    return str(match.group(1)) if match else None
+    if data.startswith(LOCAL_NAME_PREFIX):
+        mac_code = data[len(LOCAL_NAME_PREFIX) :]
+        if is_valid_mac(mac_code):
+            return mac_code
+    return None
 
 
 class CouldNotFindMotor(HomeAssistantError):
@@ -40,7 +40,10 @@ ICON_VERTICAL_BLIND = "mdi:blinds-vertical-closed"
 
 MANUFACTURER = "MotionBlinds - Coulisse"
 
+SETTING_DISCOVERY_TIMEOUT = 5  # Seconds
 SETTING_MAX_MOTOR_FEEDBACK_TIME = 2  # Seconds
+SETTING_SIGNAL_STRENGTH_MAX_INTERVAL = 30  # Seconds
+SETTING_SIGNAL_STRENGTH_MIN_CHANGE = 3  # dBm
 
 
 class MotionCalibrationType(StrEnum):
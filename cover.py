@@ -1,11 +1,13 @@
 """Cover entities for the MotionBlinds BLE integration."""
 from __future__ import annotations
 
-from asyncio import Event
-from collections.abc import Callable, Mapping
+from asyncio import Future, shield
+from collections.abc import Callable, Coroutine, Mapping
 from dataclasses import dataclass, field
 from functools import partial
 import logging
+from operator import attrgetter
+import time
 from typing import Any
 
 from motionblindsble.const import (
@@ -34,7 +36,7 @@ from homeassistant.components.cover import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_call_later
 
@@ -48,6 +50,8 @@ from .const import (
     EXCEPTION_NOT_CALIBRATED,
     ICON_VERTICAL_BLIND,
     MANUFACTURER,
+    SETTING_SIGNAL_STRENGTH_MAX_INTERVAL,
+    SETTING_SIGNAL_STRENGTH_MIN_CHANGE,
     MotionBlindType,
     MotionCalibrationType,
 )
@@ -68,12 +72,12 @@ def generic_method_decorator(
 
 def run_command(func: Callable) -> Callable:
     """Decorate a method that moves the motor position."""
-    return generic_method_decorator(lambda self: self.run_command_function, func)
+    return generic_method_decorator(attrgetter("run_command_function"), func)
 
 
 def no_run_command(func: Callable) -> Callable:
     """Decorate a method that does not move the motor position."""
-    return generic_method_decorator(lambda self: self.no_run_command_function, func)
+    return generic_method_decorator(attrgetter("no_run_command_function"), func)
 
 
 @dataclass(frozen=True)
@@ -85,23 +89,25 @@ class MotionCoverEntityDescription(CoverEntityDescription):
     device_class: CoverDeviceClass = field(default=CoverDeviceClass.SHADE, init=True)
 
 
-COVER_TYPES: dict[str, MotionCoverEntityDescription] = {
-    MotionBlindType.ROLLER.value: MotionCoverEntityDescription(),
-    MotionBlindType.HONEYCOMB.value: MotionCoverEntityDescription(),
-    MotionBlindType.ROMAN.value: MotionCoverEntityDescription(),
-    MotionBlindType.VENETIAN.value: MotionCoverEntityDescription(
-        device_class=CoverDeviceClass.BLIND
-    ),
-    MotionBlindType.VENETIAN_TILT_ONLY.value: MotionCoverEntityDescription(
-        device_class=CoverDeviceClass.BLIND
-    ),
-    MotionBlindType.DOUBLE_ROLLER.value: MotionCoverEntityDescription(),
-    MotionBlindType.CURTAIN.value: MotionCoverEntityDescription(
-        device_class=CoverDeviceClass.CURTAIN
-    ),
-    MotionBlindType.VERTICAL.value: MotionCoverEntityDescription(
-        device_class=CoverDeviceClass.CURTAIN, icon=ICON_VERTICAL_BLIND
-    ),
+POSITION_FEATURES = (
+    CoverEntityFeature.OPEN
+    | CoverEntityFeature.CLOSE
+    | CoverEntityFeature.STOP
+    | CoverEntityFeature.SET_POSITION
+)
+TILT_FEATURES = (
+    CoverEntityFeature.OPEN_TILT
+    | CoverEntityFeature.CLOSE_TILT
+    | CoverEntityFeature.STOP_TILT
+    | CoverEntityFeature.SET_TILT_POSITION
+)
+
+RUNNING_TYPE_TO_OPENING_CLOSING: dict[MotionRunningType | None, tuple[bool, bool]] = {
+    None: (False, False),
+    MotionRunningType.STILL: (False, False),
+    MotionRunningType.UNKNOWN: (False, False),
+    MotionRunningType.OPENING: (True, False),
+    MotionRunningType.CLOSING: (False, True),
 }
 
 
@@ -110,8 +116,8 @@ async def async_setup_entry(
 ) -> None:
     """Set up blind based on a config entry."""
 
-    blind_type = BLIND_TO_ENTITY_TYPE[entry.data[CONF_BLIND_TYPE]]
-    blind = blind_type(entry)
+    blind_class, entity_description = BLIND_TYPES[entry.data[CONF_BLIND_TYPE]]
+    blind = blind_class(entry, entity_description)
 
     hass.data[DOMAIN][entry.entry_id] = blind
 
@@ -130,26 +136,35 @@ class GenericBlind(CoverEntity):
     _use_status_position_update_ui: bool = False
 
     _battery_callback: Callable[[int | None], None] | None = None
+    _last_battery_percentage: int | None = None
     _speed_callback: Callable[[MotionSpeedLevel | None], None] | None = None
     _connection_callback: Callable[[MotionConnectionType | None], None] | None = None
     _signal_strength_callback: Callable[[int | None], None] | None = None
+    _last_signal_strength: int | None = None
+    _last_signal_strength_time: float = 0
 
-    def __init__(self, entry: ConfigEntry) -> None:
+    def __init__(
+        self, entry: ConfigEntry, entity_description: MotionCoverEntityDescription
+    ) -> None:
         """Initialize the blind."""
+        blind_type: str = entry.data[CONF_BLIND_TYPE]
+        address: str = entry.data[CONF_ADDRESS]
+        mac_code: str = entry.data[CONF_MAC_CODE]
         _LOGGER.info(
             "(%s) Setting up %s cover entity (%s)",
-            entry.data[CONF_MAC_CODE],
-            entry.data[CONF_BLIND_TYPE],
-            BLIND_TO_ENTITY_TYPE[entry.data[CONF_BLIND_TYPE]].__name__,
+            mac_code,
+            blind_type,
+            type(self).__name__,
         )
         super().__init__()
-        self.entity_description = COVER_TYPES[entry.data[CONF_BLIND_TYPE]]
+        self.entity_description = entity_description
         self.config_entry: ConfigEntry = entry
-        self.device_address: str = entry.data[CONF_ADDRESS]
-        self._attr_name: str = ENTITY_NAME.format(mac_code=entry.data[CONF_MAC_CODE])
-        self._attr_unique_id: str = entry.data[CONF_ADDRESS]
+        self.device_address: str = address
+        self._attr_name: str = ENTITY_NAME.format(mac_code=mac_code)
+        self._attr_unique_id: str = address
         self._attr_device_info: DeviceInfo = DeviceInfo(
-            identifiers={(DOMAIN, entry.data[CONF_MAC_CODE])},
+            connections={(CONNECTION_BLUETOOTH, address)},
+            identifiers={(DOMAIN, mac_code)},
             manufacturer=MANUFACTURER,
             name=self._attr_name,
         )
@@ -157,9 +172,13 @@ class GenericBlind(CoverEntity):
         self._attr_is_opening: bool | None = None
         self._attr_is_closing: bool | None = None
         self._attr_should_poll: bool = False
+        self._attr_extra_state_attributes: Mapping[str, Any] = {
+            ATTR_CONNECTION_TYPE: self._attr_connection_type
+        }
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
+        await super().async_added_to_hass()
         ble_device = (
             async_ble_device_from_address(self.hass, self.device_address)
             if self.device_address
@@ -168,11 +187,13 @@ class GenericBlind(CoverEntity):
         self._device = MotionDevice(
             self.device_address, ble_device, device_name=self._attr_name
         )
-        async_register_callback(
-            self.hass,
-            self.async_update_ble_device,
-            BluetoothCallbackMatcher(address=self.device_address),
-            BluetoothScanningMode.ACTIVE,
+        self.async_on_remove(
+            async_register_callback(
+                self.hass,
+                self.async_update_ble_device,
+                BluetoothCallbackMatcher(address=self.device_address),
+                BluetoothScanningMode.ACTIVE,
+            )
         )
         # Pass functions used to schedule tasks
         self._device.set_ha_create_task(
@@ -183,13 +204,11 @@ class GenericBlind(CoverEntity):
             )
         )
         self._device.set_ha_call_later(partial(async_call_later, hass=self.hass))
-        self.hass.data[DOMAIN][self.entity_id] = self
         # Register callbacks
         self._device.register_running_callback(self.async_update_running)
         self._device.register_position_callback(self.async_update_position)
         self._device.register_connection_callback(self.async_update_connection)
         self._device.register_status_callback(self.async_update_status)
-        await super().async_added_to_hass()
 
     async def async_update(self) -> None:
         """Update state, called by HA if there is a poll interval and by the service homeassistant.update_entity."""
@@ -238,31 +257,31 @@ class GenericBlind(CoverEntity):
     async def async_speed(self, speed_level: MotionSpeedLevel, **kwargs: Any) -> None:
         """Change the speed level of the device."""
         _LOGGER.info(
-            "(%s) Changing speed to {speed_level.name.lower()}",
+            "(%s) Changing speed to %s",
             self.config_entry.data[CONF_MAC_CODE],
+            speed_level.name.lower(),
         )
         await self._device.speed(speed_level)
 
+    @callback
     def async_update_running(
         self, running_type: MotionRunningType | None, write_state: bool = True
     ) -> None:
         """Update whether the blind is running (opening/closing) or not."""
         self._running_type = running_type
-        self._attr_is_opening = (
-            False
-            if running_type
-            in [None, MotionRunningType.STILL, MotionRunningType.UNKNOWN]
-            else running_type is MotionRunningType.OPENING
+        is_opening, is_closing = RUNNING_TYPE_TO_OPENING_CLOSING[running_type]
+        is_closed = (
+            self._attr_is_closed if running_type is MotionRunningType.STILL else None
         )
-        self._attr_is_closing = (
-            False
-            if running_type
-            in [None, MotionRunningType.STILL, MotionRunningType.UNKNOWN]
-            else running_type is not MotionRunningType.OPENING
+        changed = (
+            is_opening != self._attr_is_opening
+            or is_closing != self._attr_is_closing
+            or is_closed != self._attr_is_closed
         )
-        if running_type is not MotionRunningType.STILL:
-            self._attr_is_closed = None
-        if write_state:
+        self._attr_is_opening = is_opening
+        self._attr_is_closing = is_closing
+        self._attr_is_closed = is_closed
+        if write_state and changed:
             self.async_write_ha_state()
 
     @callback
@@ -279,25 +298,35 @@ class GenericBlind(CoverEntity):
             new_position_percentage,
             new_angle_percentage,
         )
-        if isinstance(self, PositionCalibrationBlind):
-            self.async_update_calibration(end_position_info)
+        new_position = 100 - new_position_percentage
+        new_tilt_position = 100 - new_angle_percentage
+        if (
+            new_position == self._attr_current_cover_position
+            and new_tilt_position == self._attr_current_cover_tilt_position
+            and self._attr_is_closed == (new_position == 0)
+        ):
+            # Nothing changed, no need to write the state
+            return
         # Only update running type to still if position has changed
-        if self._attr_current_cover_position != 100 - new_position_percentage:
+        if self._attr_current_cover_position != new_position:
             self.async_update_running(MotionRunningType.STILL, write_state=False)
-        self._attr_current_cover_position = 100 - new_position_percentage
-        self._attr_current_cover_tilt_position = 100 - new_angle_percentage
-        self._attr_is_closed = self._attr_current_cover_position == 0
+        self._attr_current_cover_position = new_position
+        self._attr_current_cover_tilt_position = new_tilt_position
+        self._attr_is_closed = new_position == 0
         self.async_write_ha_state()
 
     @callback
     def async_update_connection(self, connection_type: MotionConnectionType) -> None:
         """Update the connection status."""
+        if connection_type is self._attr_connection_type:
+            return
         _LOGGER.info(
             "(%s) %s",
             self.config_entry.data[CONF_MAC_CODE],
             connection_type.value.title(),
         )
         self._attr_connection_type = connection_type
+        self._attr_extra_state_attributes = {ATTR_CONNECTION_TYPE: connection_type}
         if self._connection_callback is not None:
             self._connection_callback(connection_type)
         # Reset states if connection is lost, since we don't know the cover position anymore
@@ -308,6 +337,7 @@ class GenericBlind(CoverEntity):
             self._attr_current_cover_tilt_position = None
             if self._speed_callback is not None:
                 self._speed_callback(None)
+            self._last_battery_percentage = None
             if self._battery_callback is not None:
                 self._battery_callback(None)
         self.async_write_ha_state()
@@ -333,32 +363,57 @@ class GenericBlind(CoverEntity):
             end_position_info.down,
             end_position_info.favorite,
         )
+        write_state = False
         # Only update position based on feedback when necessary and end positions are set, otherwise cover UI will jump around
         if self._use_status_position_update_ui and end_position_info.up:
-            self._attr_current_cover_position = 100 - position_percentage
-            self._attr_current_cover_tilt_position = 100 - tilt_percentage
-            self._attr_is_closed = self._attr_current_cover_position == 0
+            new_position = 100 - position_percentage
+            new_tilt_position = 100 - tilt_percentage
+            write_state = (
+                new_position != self._attr_current_cover_position
+                or new_tilt_position != self._attr_current_cover_tilt_position
+                or self._attr_is_closed != (new_position == 0)
+            )
+            self._attr_current_cover_position = new_position
+            self._attr_current_cover_tilt_position = new_tilt_position
+            self._attr_is_closed = new_position == 0
 
         self._use_status_position_update_ui = False
 
-        if self._battery_callback is not None:
+        if (
+            self._battery_callback is not None
+            and battery_percentage != self._last_battery_percentage
+        ):
+            self._last_battery_percentage = battery_percentage
             self._battery_callback(battery_percentage)
         if self._speed_callback is not None:
             self._speed_callback(speed_level)
-        if isinstance(self, PositionCalibrationBlind):
-            self.async_update_calibration(end_position_info)
-        self.async_write_ha_state()
+        if write_state:
+            self.async_write_ha_state()
 
     @callback
     def async_update_ble_device(
         self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
     ) -> None:
         """Update the BLEDevice."""
-        _LOGGER.info("(%s) New BLE device found", service_info.address)
+        _LOGGER.debug("(%s) New BLE device found", service_info.address)
         self._device.set_ble_device(service_info.device)
         self.device_rssi = service_info.advertisement.rssi
-        if callable(self._signal_strength_callback):
-            self._signal_strength_callback(self.device_rssi)
+        if self._signal_strength_callback is None:
+            return
+        # Throttle signal strength updates, the RSSI changes with every advertisement
+        now = time.monotonic()
+        if (
+            self._last_signal_strength is not None
+            and self.device_rssi is not None
+            and abs(self.device_rssi - self._last_signal_strength)
+            < SETTING_SIGNAL_STRENGTH_MIN_CHANGE
+            and now - self._last_signal_strength_time
+            < SETTING_SIGNAL_STRENGTH_MAX_INTERVAL
+        ):
+            return
+        self._last_signal_strength = self.device_rssi
+        self._last_signal_strength_time = now
+        self._signal_strength_callback(self.device_rssi)
 
     def async_register_battery_callback(
         self, _battery_callback: Callable[[int | None], None]
@@ -384,12 +439,20 @@ class GenericBlind(CoverEntity):
         """Register the callback used to update the signal strength."""
         self._signal_strength_callback = _signal_strength_callback
 
-    @property
-    def extra_state_attributes(self) -> Mapping[str, str]:
-        """Return the state attributes."""
-        return {ATTR_CONNECTION_TYPE: self._attr_connection_type}
+    async def async_run_motion_command(
+        self,
+        running_type: MotionRunningType,
+        command: Callable[..., Coroutine[Any, Any, bool]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Set the running type and run a motion command, revert to still if it fails."""
+        self.async_update_running(running_type)
+        if not await command(*args, **kwargs):
+            self.async_update_running(MotionRunningType.STILL)
 
-    async def before_command_function(self, *args, **kwargs) -> None:
+    @callback
+    def before_command_function(self, *args, **kwargs) -> None:
         """Run some code before executing any command."""
         if self._attr_connection_type is MotionConnectionType.CONNECTED:
             self.async_refresh_disconnect_timer()
@@ -403,7 +466,7 @@ class GenericBlind(CoverEntity):
         **kwargs,
     ) -> bool:
         """Run some code before executing any command that moves the position of the blind."""
-        await self.before_command_function(*args, **kwargs)
+        self.before_command_function(*args, **kwargs)
         if self._attr_connection_type is not MotionConnectionType.CONNECTED:
             self._use_status_position_update_ui = False
         return await func(
@@ -416,7 +479,7 @@ class GenericBlind(CoverEntity):
     # Decorator
     async def no_run_command_function(self, func: Callable, *args, **kwargs) -> bool:
         """Run some code before executing any command that does not move the position of the blind."""
-        await self.before_command_function(*args, **kwargs)
+        self.before_command_function(*args, **kwargs)
         if self._attr_connection_type is not MotionConnectionType.CONNECTED:
             self._use_status_position_update_ui = True
             self.async_update_running(MotionRunningType.STILL)
@@ -426,12 +489,7 @@ class GenericBlind(CoverEntity):
 class PositionBlind(GenericBlind):
     """Representation of a blind with position capability."""
 
-    _attr_supported_features: CoverEntityFeature | None = (
-        CoverEntityFeature.OPEN
-        | CoverEntityFeature.CLOSE
-        | CoverEntityFeature.STOP
-        | CoverEntityFeature.SET_POSITION
-    )
+    _attr_supported_features: CoverEntityFeature | None = POSITION_FEATURES
 
     @run_command
     async def async_open_cover(
@@ -439,13 +497,11 @@ class PositionBlind(GenericBlind):
     ) -> None:
         """Open the blind."""
         _LOGGER.info("(%s) Opening", self.config_entry.data[CONF_MAC_CODE])
-        self.async_update_running(MotionRunningType.OPENING)
-        if await self._device.open(
-            ignore_end_positions_not_set=ignore_end_positions_not_set
-        ):
-            self.async_write_ha_state()
-        else:
-            self.async_update_running(MotionRunningType.STILL)
+        await self.async_run_motion_command(
+            MotionRunningType.OPENING,
+            self._device.open,
+            ignore_end_positions_not_set=ignore_end_positions_not_set,
+        )
 
     @run_command
     async def async_close_cover(
@@ -453,56 +509,51 @@ class PositionBlind(GenericBlind):
     ) -> None:
         """Close the blind."""
         _LOGGER.info("(%s) Closing", self.config_entry.data[CONF_MAC_CODE])
-        self.async_update_running(MotionRunningType.CLOSING)
-        if await self._device.close(
-            ignore_end_positions_not_set=ignore_end_positions_not_set
-        ):
-            self.async_write_ha_state()
-        else:
-            self.async_update_running(MotionRunningType.STILL)
+        await self.async_run_motion_command(
+            MotionRunningType.CLOSING,
+            self._device.close,
+            ignore_end_positions_not_set=ignore_end_positions_not_set,
+        )
 
     @run_command
     async def async_set_cover_position(
         self, ignore_end_positions_not_set: bool = False, **kwargs: Any
     ) -> None:
         """Move the blind to a specific position."""
-        new_position: int | None = (
-            100 - int(kwargs[ATTR_POSITION])
-            if ATTR_POSITION in kwargs and kwargs[ATTR_POSITION] is not None
+        position: int | None = (
+            int(kwargs[ATTR_POSITION])
+            if kwargs.get(ATTR_POSITION) is not None
             else None
         )
+        new_position: int | None = 100 - position if position is not None else None
+        current_position = self._attr_current_cover_position
 
         _LOGGER.info(
             "(%s) Setting position to %i",
             self.config_entry.data[CONF_MAC_CODE],
             new_position,
         )
-        self.async_update_running(
+        running_type = (
             MotionRunningType.UNKNOWN
-            if self._attr_current_cover_position is None or new_position is None
+            if current_position is None or position is None
             else MotionRunningType.STILL
-            if new_position == 100 - self._attr_current_cover_position
+            if position == current_position
             else MotionRunningType.OPENING
-            if new_position < 100 - self._attr_current_cover_position
+            if position > current_position
             else MotionRunningType.CLOSING
         )
-        if await self._device.percentage(
-            new_position, ignore_end_positions_not_set=ignore_end_positions_not_set
-        ):
-            self.async_write_ha_state()
-        else:
-            self.async_update_running(MotionRunningType.STILL)
+        await self.async_run_motion_command(
+            running_type,
+            self._device.percentage,
+            new_position,
+            ignore_end_positions_not_set=ignore_end_positions_not_set,
+        )
 
 
 class TiltBlind(GenericBlind):
     """Representation of a blind with tilt capability."""
 
-    _attr_supported_features: CoverEntityFeature | None = (
-        CoverEntityFeature.OPEN_TILT
-        | CoverEntityFeature.CLOSE_TILT
-        | CoverEntityFeature.STOP_TILT
-        | CoverEntityFeature.SET_TILT_POSITION
-    )
+    _attr_supported_features: CoverEntityFeature | None = TILT_FEATURES
 
     @run_command
     async def async_open_cover_tilt(
@@ -510,13 +561,11 @@ class TiltBlind(GenericBlind):
     ) -> None:
         """Tilt the blind open."""
         _LOGGER.info("(%s) Tilt opening", self.config_entry.data[CONF_MAC_CODE])
-        self.async_update_running(MotionRunningType.OPENING)
-        if await self._device.open_tilt(
-            ignore_end_positions_not_set=ignore_end_positions_not_set
-        ):
-            self.async_write_ha_state()
-        else:
-            self.async_update_running(MotionRunningType.STILL)
+        await self.async_run_motion_command(
+            MotionRunningType.OPENING,
+            self._device.open_tilt,
+            ignore_end_positions_not_set=ignore_end_positions_not_set,
+        )
 
     @run_command
     async def async_close_cover_tilt(
@@ -524,13 +573,11 @@ class TiltBlind(GenericBlind):
     ) -> None:
         """Tilt the blind closed."""
         _LOGGER.info("(%s) Tilt closing", self.config_entry.data[CONF_MAC_CODE])
-        self.async_update_running(MotionRunningType.CLOSING)
-        if await self._device.close_tilt(
-            ignore_end_positions_not_set=ignore_end_positions_not_set
-        ):
-            self.async_write_ha_state()
-        else:
-            self.async_update_running(MotionRunningType.STILL)
+        await self.async_run_motion_command(
+            MotionRunningType.CLOSING,
+            self._device.close_tilt,
+            ignore_end_positions_not_set=ignore_end_positions_not_set,
+        )
 
     @run_command
     async def async_stop_cover_tilt(self, **kwargs: Any) -> None:
@@ -542,46 +589,43 @@ class TiltBlind(GenericBlind):
         self, ignore_end_positions_not_set: bool = False, **kwargs: Any
     ) -> None:
         """Tilt the blind to a specific position."""
-        new_tilt_position: int | None = (
-            100 - int(kwargs[ATTR_TILT_POSITION])
-            if ATTR_TILT_POSITION in kwargs and kwargs[ATTR_TILT_POSITION] is not None
+        tilt_position: int | None = (
+            int(kwargs[ATTR_TILT_POSITION])
+            if kwargs.get(ATTR_TILT_POSITION) is not None
             else None
         )
+        new_tilt_position: int | None = (
+            100 - tilt_position if tilt_position is not None else None
+        )
+        current_tilt_position = self._attr_current_cover_tilt_position
 
         _LOGGER.info(
             "(%s) Setting tilt position to %i",
             self.config_entry.data[CONF_MAC_CODE],
             new_tilt_position,
         )
-        self.async_update_running(
+        running_type = (
             MotionRunningType.STILL
-            if self._attr_current_cover_tilt_position is None
-            or new_tilt_position is None
-            or new_tilt_position == 100 - self._attr_current_cover_tilt_position
+            if current_tilt_position is None
+            or tilt_position is None
+            or tilt_position == current_tilt_position
             else MotionRunningType.OPENING
-            if new_tilt_position < 100 - self._attr_current_cover_tilt_position
+            if tilt_position > current_tilt_position
             else MotionRunningType.CLOSING
         )
-        if await self._device.percentage_tilt(
-            new_tilt_position, ignore_end_positions_not_set=ignore_end_positions_not_set
-        ):
-            self.async_write_ha_state()
-        else:
-            self.async_update_running(MotionRunningType.STILL)
+        await self.async_run_motion_command(
+            running_type,
+            self._device.percentage_tilt,
+            new_tilt_position,
+            ignore_end_positions_not_set=ignore_end_positions_not_set,
+        )
 
 
 class PositionTiltBlind(PositionBlind, TiltBlind):
     """Representation of a blind with position & tilt capabilities."""
 
     _attr_supported_features: CoverEntityFeature | None = (
-        CoverEntityFeature.OPEN
-        | CoverEntityFeature.CLOSE
-        | CoverEntityFeature.STOP
-        | CoverEntityFeature.SET_POSITION
-        | CoverEntityFeature.OPEN_TILT
-        | CoverEntityFeature.CLOSE_TILT
-        | CoverEntityFeature.STOP_TILT
-        | CoverEntityFeature.SET_TILT_POSITION
+        POSITION_FEATURES | TILT_FEATURES
     )
 
 
@@ -591,6 +635,7 @@ class PositionCalibrationBlind(PositionBlind):
     _calibration_type: MotionCalibrationType | None = None
     _calibration_callback: Callable[[MotionCalibrationType | None], None] | None = None
 
+    @callback
     def async_update_running(
         self, running_type: MotionRunningType | None, write_state: bool = True
     ) -> None:
@@ -610,7 +655,7 @@ class PositionCalibrationBlind(PositionBlind):
                 self.config_entry.data[CONF_MAC_CODE],
             )
             self._calibration_type = MotionCalibrationType.CALIBRATING
-            if callable(self._calibration_callback):
+            if self._calibration_callback is not None:
                 self._calibration_callback(MotionCalibrationType.CALIBRATING)
             self.async_refresh_disconnect_timer(SETTING_CALIBRATION_DISCONNECT_TIME)
         super().async_update_running(running_type, write_state)
@@ -641,9 +686,41 @@ class PositionCalibrationBlind(PositionBlind):
             # Refresh disconnect timeout to default value if finished calibrating
             self.async_refresh_disconnect_timer(force=True)
         self._calibration_type = new_calibration_type
-        if callable(self._calibration_callback):
+        if self._calibration_callback is not None:
             self._calibration_callback(new_calibration_type)
 
+    @callback
+    def async_update_position(
+        self,
+        new_position_percentage: int,
+        new_angle_percentage: int,
+        end_position_info: MotionPositionInfo,
+    ) -> None:
+        """Update the calibration status, then the position of the motor."""
+        self.async_update_calibration(end_position_info)
+        super().async_update_position(
+            new_position_percentage, new_angle_percentage, end_position_info
+        )
+
+    @callback
+    def async_update_status(
+        self,
+        position_percentage: int,
+        tilt_percentage: int,
+        battery_percentage: int,
+        speed_level: MotionSpeedLevel | None,
+        end_position_info: MotionPositionInfo,
+    ) -> None:
+        """Update motor status, then the calibration status."""
+        super().async_update_status(
+            position_percentage,
+            tilt_percentage,
+            battery_percentage,
+            speed_level,
+            end_position_info,
+        )
+        self.async_update_calibration(end_position_info)
+
     def async_register_calibration_callback(
         self, _calibration_callback: Callable[[MotionCalibrationType | None], None]
     ) -> None:
@@ -656,6 +733,7 @@ class PositionCalibrationBlind(PositionBlind):
         if (
             self._calibration_callback is not None
             and connection_type is MotionConnectionType.DISCONNECTED
+            and connection_type is not self._attr_connection_type
         ):
             # Set calibration to None if disconnected
             self._calibration_callback(None)
@@ -675,18 +753,21 @@ class PositionCalibrationBlind(PositionBlind):
 class PositionTiltCalibrationBlind(PositionCalibrationBlind, PositionTiltBlind):
     """Representation of a blind with position, tilt and calibration capabilities."""
 
-    _calibration_event: Event = Event()
+    _calibration_future: Future[None] | None = None
 
     # Decorator
     async def run_command_function(self, func: Callable, *args, **kwargs) -> bool:
         """Run before every command that moves a blind, return whether or not to proceed with the command."""
         # Do not throw an exception if the end positions are not set but a move command is given
         if not self._device.is_connected():
-            self._calibration_event.clear()
+            if self._calibration_future is None or self._calibration_future.done():
+                self._calibration_future = self.hass.loop.create_future()
+            calibration_future = self._calibration_future
             if not await self.async_connect():
                 return False
-            # Wait for calibration attribute to get a value
-            await self._calibration_event.wait()
+            # Wait for calibration attribute to get a value, shielded so that
+            # cancelling one command does not cancel the others waiting on it
+            await shield(calibration_future)
         # If motor is not calibrated, raise an exception
         if self._calibration_type is not MotionCalibrationType.CALIBRATED:
             raise NotCalibratedException(
@@ -698,20 +779,38 @@ class PositionTiltCalibrationBlind(PositionCalibrationBlind, PositionTiltBlind):
     def async_update_calibration(self, end_position_info: MotionPositionInfo) -> None:
         """Update the calibration status."""
         super().async_update_calibration(end_position_info)
-        self._calibration_event.set()
+        if self._calibration_future is not None and not self._calibration_future.done():
+            self._calibration_future.set_result(None)
 
 
 class NotCalibratedException(Exception):
     """Exception to indicate the blinds are not calibrated."""
 
 
-BLIND_TO_ENTITY_TYPE: dict[str, type[GenericBlind]] = {
-    MotionBlindType.ROLLER.value: PositionBlind,
-    MotionBlindType.HONEYCOMB.value: PositionBlind,
-    MotionBlindType.ROMAN.value: PositionBlind,
-    MotionBlindType.VENETIAN.value: PositionTiltBlind,
-    MotionBlindType.VENETIAN_TILT_ONLY.value: TiltBlind,
-    MotionBlindType.DOUBLE_ROLLER.value: PositionTiltBlind,
-    MotionBlindType.CURTAIN.value: PositionCalibrationBlind,
-    MotionBlindType.VERTICAL.value: PositionTiltCalibrationBlind,
+BLIND_TYPES: dict[str, tuple[type[GenericBlind], MotionCoverEntityDescription]] = {
+    MotionBlindType.ROLLER.value: (PositionBlind, MotionCoverEntityDescription()),
+    MotionBlindType.HONEYCOMB.value: (PositionBlind, MotionCoverEntityDescription()),
+    MotionBlindType.ROMAN.value: (PositionBlind, MotionCoverEntityDescription()),
+    MotionBlindType.VENETIAN.value: (
+        PositionTiltBlind,
+        MotionCoverEntityDescription(device_class=CoverDeviceClass.BLIND),
+    ),
+    MotionBlindType.VENETIAN_TILT_ONLY.value: (
+        TiltBlind,
+        MotionCoverEntityDescription(device_class=CoverDeviceClass.BLIND),
+    ),
+    MotionBlindType.DOUBLE_ROLLER.value: (
+        PositionTiltBlind,
+        MotionCoverEntityDescription(),
+    ),
+    MotionBlindType.CURTAIN.value: (
+        PositionCalibrationBlind,
+        MotionCoverEntityDescription(device_class=CoverDeviceClass.CURTAIN),
+    ),
+    MotionBlindType.VERTICAL.value: (
+        PositionTiltCalibrationBlind,
+        MotionCoverEntityDescription(
+            device_class=CoverDeviceClass.CURTAIN, icon=ICON_VERTICAL_BLIND
+        ),
+    ),
 }
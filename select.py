@@ -71,8 +71,8 @@ class SpeedSelect(SelectEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
+        await super().async_added_to_hass()
         self._blind.async_register_speed_callback(self.async_update_speed)
-        return await super().async_added_to_hass()
 
     @callback
     def async_update_speed(self, speed_level: MotionSpeedLevel | None) -> None:
@@ -106,10 +106,10 @@ class BatterySensor(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
+        await super().async_added_to_hass()
         self._blind.async_register_battery_callback(
             self.async_update_battery_percentage
         )
-        return await super().async_added_to_hass()
 
     @callback
     def async_update_battery_percentage(self, battery_percentage: int | None) -> None:
@@ -161,8 +161,8 @@ class ConnectionSensor(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
+        await super().async_added_to_hass()
         self._blind.async_register_connection_callback(self.async_update_connection)
-        return await super().async_added_to_hass()
 
     @callback
     def async_update_connection(
@@ -190,8 +190,8 @@ class CalibrationSensor(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
+        await super().async_added_to_hass()
         self._blind.async_register_calibration_callback(self.async_update_calibration)
-        return await super().async_added_to_hass()
 
     @callback
     def async_update_calibration(
@@ -219,11 +219,12 @@ class SignalStrengthSensor(SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added."""
+        await super().async_added_to_hass()
         self._blind.async_register_signal_strength_callback(
             self.async_update_signal_strength
         )
-        self.async_update_signal_strength(self._blind.device_rssi)
-        return await super().async_added_to_hass()
+        # State is written by Home Assistant once the entity has been added
+        self._attr_native_value = self._blind.device_rssi
 
     @callback
     def async_update_signal_strength(self, signal_strength: int | None) -> None: